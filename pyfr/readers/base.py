@@ -55,7 +55,7 @@ class NodalMeshAssembler:
     def _check_pyr_parallelogram(self, foeles):
         # Find PyFR node map for the quad face
         fnmap = self._petype_fnmap['pyr']['quad'][0]
-        pfnmap = [self._nodemaps['quad', 4][i] for i in fnmap]
+        pfnmap = [self._nodemaps.get('quad', 4)[i] for i in fnmap]
 
         # Face nodes
         fpts = self._nodepts[foeles[:, pfnmap]].swapaxes(0, 1)
@@ -242,11 +242,12 @@ class NodalMeshAssembler:
             ndim = self._petype_ndim[petype]
 
             # Node maps between input and PyFR orderings
-            itop = self._nodemaps[petype, nnodes]
-            ptoi = np.argsort(itop)
+            itop, ptoi = self._nodemaps.maps_ix[petype, nnodes]
 
-            # Construct the element array
-            eles = self._nodepts[elesix[:, itop], :ndim].swapaxes(0, 1)
+            # Construct the element array; permuting the transposed
+            # (nnodes, nelems) view makes the map a row reorder and
+            # directly yields the desired axis order
+            eles = self._nodepts[elesix.T[itop], :ndim]
 
             # Generate the associated polynomial bases
             shape = subclass_where(BaseShape, name=petype)
@@ -286,14 +287,15 @@ class NodalMeshAssembler:
             eles = self._elenodes[etype, pent]
             petype, nnodes = self._etype_map[etype]
 
-            # Go from Gmsh to PyFR node ordering
-            peles = eles[:, self._nodemaps[petype, nnodes]]
+            # Go from Gmsh to PyFR node ordering; as above the map is
+            # applied to the transposed (nnodes, nelems) view
+            peles = eles.T[self._nodemaps.get_ix(petype, nnodes)]
 
             # Obtain the dimensionality of the element type
             ndim = self._petype_ndim[petype]
 
             # Build the array
-            arr = self._nodepts[peles, :ndim].swapaxes(0, 1)
+            arr = self._nodepts[peles, :ndim]
 
             spts[f'spt_{petype}_p0'] = arr
             spts[f'spt_{petype}_p0', 'linear'] = lidx[petype]
@@ -0,0 +1,378 @@
+import base64
+import functools as ft
+import itertools as it
+from types import MappingProxyType
+
+import numpy as np
+
+
+def _inv(v):
+    # Invert a permutation with a scatter; O(n) versus argsort
+    inv = np.empty_like(v)
+    inv[v] = np.arange(v.size, dtype=v.dtype)
+    inv.flags.writeable = False
+
+    return inv
+
+
+def _gmsh_edges(c, edges, p):
+    # Points interior to each edge of an element, edge by edge
+    return [tuple(a + (b - a)*t // p for a, b in zip(c[i], c[j]))
+            for i, j in edges
+            for t in range(1, p)]
+
+
+def _gmsh_face(c0, cu, cv, p, inner):
+    # Embed face-local interior coordinates through the face corners
+    return [tuple(a + (u - a)*s // p + (v - a)*t // p
+                  for a, u, v in zip(c0, cu, cv))
+            for s, t in inner]
+
+
+def _gmsh_quad(p):
+    # Lattice points of a p'th order quad in the Gmsh ordering
+    c = [(0, 0), (p, 0), (p, p), (0, p)]
+    if p < 2:
+        return c if p else c[:1]
+
+    pts = c + _gmsh_edges(c, [(0, 1), (1, 2), (2, 3), (3, 0)], p)
+
+    return pts + _gmsh_quad_int(p)
+
+
+def _gmsh_quad_int(p):
+    # Interior points; these recursively form a quad of order p - 2
+    return [(u + 1, v + 1) for u, v in _gmsh_quad(p - 2)] if p >= 2 else []
+
+
+def _gmsh_tri_int(p):
+    # Interior points of a p'th order Gmsh tri; these recursively form
+    # a tri of order p - 3 ordered corners, then edges, then interior
+    if p < 3:
+        return []
+
+    q = p - 3
+    c = [(0, 0), (q, 0), (0, q)]
+    if q < 1:
+        pts = c[:1]
+    else:
+        pts = c + _gmsh_edges(c, [(0, 1), (1, 2), (2, 0)], q)
+        pts += _gmsh_tri_int(q)
+
+    return [(u + 1, v + 1) for u, v in pts]
+
+
+def _gmsh_tri_cyc(p):
+    # Interior convention for standalone tris: the boundary of the
+    # inner triangle is walked as a single cycle, corners included
+    if p < 0:
+        return []
+
+    c = [(0, 0), (p, 0), (0, p)]
+    if p == 0:
+        return c[:1]
+
+    pts = []
+    for a, b in [(0, 1), (1, 2), (2, 0)]:
+        pts.append(c[a])
+        pts += [tuple(x + (y - x)*t // p for x, y in zip(c[a], c[b]))
+                for t in range(1, p)]
+
+    return pts + [(u + 1, v + 1) for u, v in _gmsh_tri_cyc(p - 3)]
+
+
+def _gmsh_tri(p):
+    # Lattice points of a p'th order tri in the Gmsh ordering
+    c = [(0, 0), (p, 0), (0, p)]
+    if p < 2:
+        return c if p else c[:1]
+
+    pts = c + _gmsh_edges(c, [(0, 1), (1, 2), (2, 0)], p)
+
+    return pts + [(u + 1, v + 1) for u, v in _gmsh_tri_cyc(p - 3)]
+
+
+def _gmsh_tet(p):
+    # Lattice points of a p'th order tet in the Gmsh ordering
+    if p < 0:
+        return []
+
+    c = [(0, 0, 0), (p, 0, 0), (0, p, 0), (0, 0, p)]
+    if p < 2:
+        return c if p else c[:1]
+
+    pts = c + _gmsh_edges(c, [(0, 1), (1, 2), (2, 0),
+                              (3, 0), (3, 2), (3, 1)], p)
+
+    tint = _gmsh_tri_int(p)
+    for a, u, v in [(0, 2, 1), (0, 1, 3), (0, 3, 2), (3, 1, 2)]:
+        pts += _gmsh_face(c[a], c[u], c[v], p, tint)
+
+    # Interior points recursively form a tet of order p - 4
+    return pts + [(u + 1, v + 1, w + 1) for u, v, w in _gmsh_tet(p - 4)]
+
+
+def _gmsh_hex(p):
+    # Lattice points of a p'th order hex in the Gmsh ordering
+    c = [(0, 0, 0), (p, 0, 0), (p, p, 0), (0, p, 0),
+         (0, 0, p), (p, 0, p), (p, p, p), (0, p, p)]
+    if p < 2:
+        return c if p else c[:1]
+
+    pts = c + _gmsh_edges(c, [(0, 1), (0, 3), (0, 4), (1, 2), (1, 5), (2, 3),
+                              (2, 6), (3, 7), (4, 5), (4, 7), (5, 6), (6, 7)],
+                          p)
+
+    qint = _gmsh_quad_int(p)
+    for a, u, v in [(0, 3, 1), (0, 1, 4), (0, 4, 3),
+                    (1, 2, 5), (2, 3, 6), (4, 5, 7)]:
+        pts += _gmsh_face(c[a], c[u], c[v], p, qint)
+
+    # Interior points recursively form a hex of order p - 2
+    return pts + [(u + 1, v + 1, w + 1) for u, v, w in _gmsh_hex(p - 2)]
+
+
+def _gmsh_pri(p):
+    # Lattice points of a p'th order prism in the Gmsh ordering
+    c = [(0, 0, 0), (p, 0, 0), (0, p, 0),
+         (0, 0, p), (p, 0, p), (0, p, p)]
+    if p < 2:
+        return c if p else c[:1]
+
+    pts = c + _gmsh_edges(c, [(0, 1), (0, 2), (0, 3), (1, 2), (1, 4),
+                              (2, 5), (3, 4), (3, 5), (4, 5)], p)
+
+    tint, qint = _gmsh_tri_int(p), _gmsh_quad_int(p)
+    for inner, (a, u, v) in [(tint, (0, 2, 1)), (tint, (3, 4, 5)),
+                             (qint, (0, 1, 3)), (qint, (0, 3, 2)),
+                             (qint, (1, 2, 4))]:
+        pts += _gmsh_face(c[a], c[u], c[v], p, inner)
+
+    # Interior: the triangular interior crossed with a Gmsh line
+    ks = [1, p - 1, *range(2, p - 1)]
+
+    return pts + [(u, v, k) for u, v in tint for k in ks]
+
+
+def _pyfr_quad(p):
+    r = range(p + 1)
+    return [(i, j) for j in r for i in r]
+
+
+def _pyfr_tri(p):
+    return [(i, j) for j in range(p + 1) for i in range(p + 1 - j)]
+
+
+def _pyfr_tet(p):
+    return [(i, j, k)
+            for k in range(p + 1)
+            for j in range(p + 1 - k)
+            for i in range(p + 1 - k - j)]
+
+
+def _pyfr_hex(p):
+    r = range(p + 1)
+    return [(i, j, k) for k in r for j in r for i in r]
+
+
+def _pyfr_pri(p):
+    return [(i, j, k)
+            for k in range(p + 1)
+            for j in range(p + 1)
+            for i in range(p + 1 - j)]
+
+
+# Element types with closed-form orderings
+_gmsh_pts = MappingProxyType({'hex': _gmsh_hex, 'pri': _gmsh_pri,
+                              'quad': _gmsh_quad, 'tet': _gmsh_tet,
+                              'tri': _gmsh_tri})
+_pyfr_pts = MappingProxyType({'hex': _pyfr_hex, 'pri': _pyfr_pri,
+                              'quad': _pyfr_quad, 'tet': _pyfr_tet,
+                              'tri': _pyfr_tri})
+
+
+@ft.cache
+def _maps(etype, n):
+    if etype in _gmsh_pts:
+        # Obtain the order associated with the node count
+        for p in it.count(1):
+            pyfr = _pyfr_pts[etype](p)
+            if len(pyfr) >= n:
+                break
+
+        if len(pyfr) != n:
+            raise KeyError((etype, n))
+
+        # Synthesise the map from the two orderings
+        pos = {a: i for i, a in enumerate(_gmsh_pts[etype](p))}
+        v = np.array([pos[a] for a in pyfr], dtype=np.int16)
+    else:
+        s = _offs[etype, n]
+        v = _blob[s:s + n]
+
+    v.flags.writeable = False
+
+    # Involutive maps are their own inverse and can be aliased
+    inv = _inv(v)
+    if np.array_equal(v, inv):
+        inv = v
+
+    # Fuse the forward and inverse maps into a single cache entry
+    return v, inv
+
+
+def _to_pyfr(etype, n):
+    return _maps(etype, n)[0]
+
+
+def _from_pyfr(etype, n):
+    return _maps(etype, n)[1]
+
+
+def _ix(v):
+    # Substitute a slice for contiguous maps, under which gathering
+    # degenerates to taking a view
+    if np.all(np.diff(v) == 1):
+        return slice(int(v[0]), int(v[-1]) + 1)
+
+    # Otherwise take a native intp copy for the fancy-indexing fast
+    # path; the compact int16 maps remain the storage format
+    v = v.astype(np.intp)
+    v.flags.writeable = False
+
+    return v
+
+
+@ft.cache
+def _maps_ix(etype, n):
+    to, frm = _maps(etype, n)
+    tix = _ix(to)
+
+    return tix, tix if frm is to else _ix(frm)
+
+
+def _to_pyfr_ix(etype, n):
+    return _maps_ix(etype, n)[0]
+
+
+def _from_pyfr_ix(etype, n):
+    return _maps_ix(etype, n)[1]
+
+
+def apply(etype, n, src, axis=1, inverse=False, out=None):
+    """Permute src along axis into the target node ordering
+
+    This is the canonical way of applying the maps to batches of
+    elements: it dispatches to the tight C loop of np.take rather than
+    the generic advanced-indexing machinery, supports a preallocated
+    out buffer for use inside caller loops, and takes a view when the
+    map is contiguous.
+    """
+    p = _maps_ix(etype, n)[inverse]
+
+    if isinstance(p, slice):
+        v = src[(slice(None),)*(axis % src.ndim) + (p,)]
+        if out is None:
+            return v
+
+        out[:] = v
+        return out
+
+    return np.take(src, p, axis=axis, out=out, mode='clip')
+
+
+@ft.cache
+def make_permuter(etype, n, inverse=False):
+    """Return a callable specialised to a single node map
+
+    The returned function permutes axis 1 of an (nelems, npts, ...)
+    array into the target ordering. The gather-ready map is bound into
+    the closure, so batch callers pay no per-call table lookups, and
+    contiguous maps permute by taking a view.
+    """
+    p = _maps_ix(etype, n)[inverse]
+
+    if isinstance(p, slice):
+        def permute(src, out=None):
+            if out is None:
+                return src[:, p]
+
+            out[:] = src[:, p]
+            return out
+    else:
+        def permute(src, out=None):
+            return np.take(src, p, axis=1, out=out, mode='clip')
+
+    return permute
+
+
+class _LazyMaps:
+    # Materialises node map tables on first access
+    __slots__ = ('_build',)
+
+    def __init__(self, build):
+        self._build = build
+
+    def __getitem__(self, k):
+        return self._build(*k)
+
+
+# Remaining tables, packed as a little-endian int16 blob with the
+# offset of each (etype, n) table given by _offs; regenerate with
+# np.concatenate([...]).astype('<i2').tobytes() over the tables
+_blob = np.frombuffer(base64.b64decode(
+    b'AAABAAMAAgAEAAAABQABAAYADQAIAAMACgACAAcACQAMAAsABAAAAAUABgABAAcAGQAcAA'
+    b'sACAAaABsADAADABAADwACAAkAFQANABYAHQAXABMAGAARAAoADgAUABIABAAAAAUABgAH'
+    b'AAEACAApADAALAAOAAkALQAxAC8ADwAKACoALgArABAAAwAWABUAFAACAAsAHQAeABEAIQ'
+    b'AyADMAIwAgADUANAAkABoAJwAmABcADAAfABIAIgA2ACUAGwAoABgADQATABwAGQAEAAAA'
+    b'BQAGAAcACAABAAkAPQBIAEcAQAARAAoAQQBJAEwARgASAAsAQgBKAEsARQATAAwAPgBDAE'
+    b'QAPwAUAAMAHAAbABoAGQACAA0AJQAoACYAFQAsAE0AUgBOADEALgBTAFoAVQA0ACsAUABX'
+    b'AE8AMgAhADgAOgA3AB0ADgAqACkAFgAvAFQAVgA2ADAAWQBYADUAIgA7ADwAHgAPACcAFw'
+    b'AtAFEAMwAjADkAHwAQABgAJAAgAAQAAAAFAAYABwAIAAkAAQAKAFUAZABjAGIAWAAUAAsA'
+    b'WQBlAGwAaABhABUADABaAGkAbQBrAGAAFgANAFsAZgBqAGcAXwAXAA4AVgBcAF0AXgBXAB'
+    b'gAAwAiACEAIAAfAB4AAgAPAC0AMAAxAC4AGQA4AG4AcwB0AG8AQQA7AHUAhwCKAHkARAA6'
+    b'AHYAiACJAHoARQA3AHEAfgB9AHAAQgAoAEwATwBOAEsAIwAQADUANgAyABoAPAB3AIMAew'
+    b'BJAEAAhACLAIUASgA/AIEAhgB/AEYAKQBQAFQAUwAkABEANAAzABsAPQB4AHwASAA+AIIA'
+    b'gABHACoAUQBSACUAEgAvABwAOQByAEMAKwBNACYAEwAdACwAJwAEAA=='
+), dtype='<i2')
+
+_offs = MappingProxyType({
+    ('pyr', 5): 0, ('pyr', 14): 5, ('pyr', 30): 19,
+    ('pyr', 55): 49, ('pyr', 91): 104, ('pyr', 140): 195
+})
+
+
+class GmshNodeMaps:
+    """Mappings between the node orderings of PyFR and Gmsh
+
+    The forward maps (to_pyfr) go from the Gmsh node ordering to that
+    of PyFR, with the inverse maps (from_pyfr) going the other way; a
+    fused (forward, inverse) pair is available through maps for code
+    which needs both directions with a single lookup.
+    All maps are read-only and are materialised lazily on first access.
+    Being immutable they can be used directly as gather indices, as in
+    nodes[to_pyfr[k]], without any need for defensive copies; the _ix
+    variants are of dtype intp and so avoid a cast when so used, and
+    degenerate to slices for maps which are contiguous.
+    """
+    __slots__ = ()
+
+    maps = _LazyMaps(_maps)
+    maps_ix = _LazyMaps(_maps_ix)
+    to_pyfr = _LazyMaps(_to_pyfr)
+    to_pyfr_ix = _LazyMaps(_to_pyfr_ix)
+    from_pyfr = _LazyMaps(_from_pyfr)
+    from_pyfr_ix = _LazyMaps(_from_pyfr_ix)
+
+    @staticmethod
+    @ft.cache
+    def get(etype, n, inverse=False):
+        """Cached accessor for a single map; cheaper than subscripting
+        in hot loops as the arguments are hashed just once"""
+        return _maps(etype, n)[inverse]
+
+    @staticmethod
+    @ft.cache
+    def get_ix(etype, n, inverse=False):
+        """As get but for the gather-ready index variants"""
+        return _maps_ix(etype, n)[inverse]